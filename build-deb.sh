@@ -21,6 +21,8 @@ mkdir -p "$PKG_DIR/usr/share/keylight"
 mkdir -p "$PKG_DIR/usr/share/applications"
 mkdir -p "$PKG_DIR/usr/share/icons/hicolor/scalable/apps"
 mkdir -p "$PKG_DIR/usr/bin"
+mkdir -p "$PKG_DIR/usr/libexec/keylight"
+mkdir -p "$PKG_DIR/usr/share/polkit-1/actions"
 
 # Copy application files
 cp -r "$SCRIPT_DIR/keylight" "$PKG_DIR/usr/share/keylight/"
@@ -29,6 +31,11 @@ cp "$SCRIPT_DIR/keylight.py" "$PKG_DIR/usr/share/keylight/"
 # Copy icon
 cp "$SCRIPT_DIR/assets/keylight.svg" "$PKG_DIR/usr/share/icons/hicolor/scalable/apps/"
 
+# Copy pkexec helper and its polkit action (used when sysfs isn't writable)
+install -m 755 "$SCRIPT_DIR/assets/keylight-writer" "$PKG_DIR/usr/libexec/keylight/"
+install -m 644 "$SCRIPT_DIR/assets/io.github.dzo4e2250.keylight.policy" \
+    "$PKG_DIR/usr/share/polkit-1/actions/"
+
 # Create desktop entry
 cat > "$PKG_DIR/usr/share/applications/keylight.desktop" << 'EOF'
 [Desktop Entry]
@@ -72,7 +79,7 @@ Section: utils
 Priority: optional
 Architecture: all
 Depends: python3, python3-gi, python3-gi-cairo, gir1.2-gtk-3.0
-Recommends: gir1.2-ayatanaappindicator3-0.1
+Recommends: gir1.2-ayatanaappindicator3-0.1, python3-orjson
 Maintainer: KeyLight <keylight@example.com>
 Description: Keyboard Backlight Controller for Linux
  KeyLight is a GTK3 application for controlling RGB keyboard
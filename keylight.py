@@ -11,80 +11,10 @@ import os
 app_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, app_dir)
 
-import gi
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gio, GLib
-
+# GTK and the GUI modules are imported in main() only when the GUI is
+# started, so CLI commands (--cycle, --toggle, ...) stay fast.
 from keylight.controller import KeyboardBacklightController
 from keylight.config import Config
-from keylight.gui import KeyLightWindow
-from keylight.tray import TrayIcon, HAS_INDICATOR
-from keylight.shortcuts import create_shortcut_script, create_toggle_script
-
-
-class KeyLightApplication(Gtk.Application):
-    """Main KeyLight application."""
-
-    def __init__(self):
-        super().__init__(
-            application_id="com.keylight.app",
-            flags=Gio.ApplicationFlags.FLAGS_NONE
-        )
-        self.window = None
-        self.tray = None
-        self.controller = KeyboardBacklightController()
-        self.config = Config()
-
-    def do_startup(self):
-        """Handle application startup."""
-        Gtk.Application.do_startup(self)
-
-        # Create shortcut scripts
-        create_shortcut_script(self.config)
-        create_toggle_script(self.config)
-
-        # Add application actions
-        action = Gio.SimpleAction.new("quit", None)
-        action.connect("activate", self.on_quit)
-        self.add_action(action)
-
-        action = Gio.SimpleAction.new("about", None)
-        action.connect("activate", self.on_about)
-        self.add_action(action)
-
-    def do_activate(self):
-        """Handle application activation."""
-        if not self.window:
-            self.window = KeyLightWindow(self)
-            self.window.connect("delete-event", self.on_window_delete)
-
-            # Create tray icon if available
-            if HAS_INDICATOR:
-                self.tray = TrayIcon(self, self.controller, self.config)
-
-        self.window.present()
-
-    def on_window_delete(self, window, event):
-        """Handle window close - minimize to tray if available."""
-        if HAS_INDICATOR and self.tray:
-            window.hide()
-            return True  # Prevent destruction
-        return False
-
-    def on_quit(self, action, param):
-        """Quit the application."""
-        self.quit()
-
-    def on_about(self, action, param):
-        """Show about dialog."""
-        about = Gtk.AboutDialog(transient_for=self.window, modal=True)
-        about.set_program_name("KeyLight")
-        about.set_version("1.0.0")
-        about.set_comments("Keyboard Backlight Controller for Linux")
-        about.set_license_type(Gtk.License.MIT_X11)
-        about.set_website("https://github.com/keylight")
-        about.run()
-        about.destroy()
 
 
 def check_requirements():
@@ -135,7 +65,7 @@ def main():
             return 1
 
         if sys.argv[1] == "--cycle":
-            colors = config.cycle_colors
+            colors = config.read_key("cycle_colors")
             idx = controller.cycle_color(colors)
             print(f"Color: {colors[idx]}")
             return 0
@@ -149,18 +79,20 @@ def main():
 
         if sys.argv[1] == "--set" and len(sys.argv) > 2:
             color = sys.argv[2]
-            controller.set_color_hex(color)
-            config.current_color = color
-            if controller.brightness == 0:
-                controller.brightness = config.brightness or 255
+            with config:
+                controller.set_color_hex(color)
+                config.current_color = color
+                if controller.brightness == 0:
+                    controller.brightness = config.brightness or 255
             print(f"Color set to {color}")
             return 0
 
         if sys.argv[1] == "--brightness" and len(sys.argv) > 2:
             try:
                 brightness = int(sys.argv[2])
-                controller.brightness = brightness
-                config.brightness = brightness
+                with config:
+                    controller.brightness = brightness
+                    config.brightness = brightness
                 print(f"Brightness set to {brightness}")
                 return 0
             except ValueError:
@@ -172,6 +104,7 @@ def main():
         return 1
 
     # Run GUI application
+    from keylight.app import KeyLightApplication
     app = KeyLightApplication()
     return app.run(sys.argv)
 
@@ -0,0 +1,84 @@
+"""
+Main GTK application for KeyLight.
+"""
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Gio
+
+from .controller import KeyboardBacklightController
+from .config import Config
+from .gui import KeyLightWindow
+from .tray import TrayIcon
+from .shortcuts import ensure_shortcut_scripts
+
+
+class KeyLightApplication(Gtk.Application):
+    """Main KeyLight application."""
+
+    def __init__(self):
+        super().__init__(
+            application_id="com.keylight.app",
+            flags=Gio.ApplicationFlags.FLAGS_NONE
+        )
+        self.window = None
+        self.tray = None
+        self.controller = KeyboardBacklightController()
+        self.config = Config()
+
+    def do_startup(self):
+        """Handle application startup."""
+        Gtk.Application.do_startup(self)
+
+        # Create shortcut scripts (skipped if already up to date)
+        ensure_shortcut_scripts(self.config)
+
+        # Add application actions
+        action = Gio.SimpleAction.new("quit", None)
+        action.connect("activate", self.on_quit)
+        self.add_action(action)
+
+        action = Gio.SimpleAction.new("about", None)
+        action.connect("activate", self.on_about)
+        self.add_action(action)
+
+    def do_activate(self):
+        """Handle application activation."""
+        if not self.window:
+            self.window = KeyLightWindow(self)
+            self.window.connect("delete-event", self.on_window_delete)
+
+            # Create tray icon (only shown if AppIndicator is available)
+            self.tray = TrayIcon(self, self.controller, self.config)
+        elif self.window.is_active():
+            return  # Already visible and focused
+
+        self.window.present()
+
+    def do_shutdown(self):
+        """Write settings the window deferred before exiting."""
+        if self.window:
+            self.window.config.flush()
+        Gtk.Application.do_shutdown(self)
+
+    def on_window_delete(self, window, event):
+        """Handle window close - minimize to tray if available."""
+        if self.tray and self.tray.indicator:
+            window.hide()
+            return True  # Prevent destruction
+        return False
+
+    def on_quit(self, action, param):
+        """Quit the application."""
+        self.quit()
+
+    def on_about(self, action, param):
+        """Show about dialog."""
+        about = Gtk.AboutDialog(transient_for=self.window, modal=True)
+        about.set_program_name("KeyLight")
+        about.set_version("1.0.0")
+        about.set_comments("Keyboard Backlight Controller for Linux")
+        about.set_license_type(Gtk.License.MIT_X11)
+        about.set_website("https://github.com/keylight")
+        about.run()
+        about.destroy()
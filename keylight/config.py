@@ -3,9 +3,28 @@ Configuration management for KeyLight.
 Stores user preferences and custom colors.
 """
 
-import json
+import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
 
 
 class Config:
@@ -42,39 +61,117 @@ class Config:
         "show_notifications": True,
     }
 
-    def __init__(self):
+    def __init__(self, lazy: bool = True):
         self.config_dir = Path.home() / ".config" / "keylight"
         self.config_file = self.config_dir / "config.json"
-        self.config: Dict[str, Any] = {}
-        self._load()
+        self._config: Optional[Dict[str, Any]] = None
+        self._last_serialized: Optional[bytes] = None
+        self._dirty = False
+        self._batch_depth = 0
+        if not lazy:
+            self._load()
 
-    def _load(self):
-        """Load configuration from file."""
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dict, loaded from file on first access."""
+        if self._config is None:
+            self._load()
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        self._config = value
+
+    def __enter__(self):
+        """Batch set() calls; the file is written once on exit."""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+        return False
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """Parse the config file. Returns None if missing or invalid."""
         try:
-            if self.config_file.exists():
-                self.config = json.loads(self.config_file.read_text())
-            else:
-                self.config = self.DEFAULT_CONFIG.copy()
-                self._save()
-        except (json.JSONDecodeError, IOError):
-            self.config = self.DEFAULT_CONFIG.copy()
+            raw = self.config_file.read_bytes()
+            data = _loads(raw)
+        except (ValueError, IOError):
+            return None
+        self._last_serialized = raw
+        return data
+
+    def _load(self):
+        """Load configuration from file.
+
+        A missing file is not written back; it is created on the first set().
+        """
+        data = self._read()
+        self._config = data if data is not None else self.DEFAULT_CONFIG.copy()
 
     def _save(self):
-        """Save configuration to file."""
+        """Atomically save configuration to file if it changed."""
+        raw = _dumps(self.config)
+        if raw == self._last_serialized:
+            return
+        tmp_path = None
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            self.config_file.write_text(json.dumps(self.config, indent=2))
+            # Replace a symlinked config's target, not the link itself
+            target = os.path.realpath(self.config_file)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(target), prefix=".config."
+            )
+            try:
+                # mkstemp creates 0600; keep the existing file's mode
+                try:
+                    os.fchmod(fd, stat.S_IMODE(os.stat(target).st_mode))
+                except FileNotFoundError:
+                    pass
+                os.write(fd, raw)
+            finally:
+                os.close(fd)
+            os.rename(tmp_path, target)
+            self._last_serialized = raw
         except IOError:
-            pass
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def flush(self):
+        """Write pending changes to disk."""
+        if self._dirty:
+            self._dirty = False
+            self._save()
 
     def get(self, key: str, default=None):
         """Get a configuration value."""
         return self.config.get(key, self.DEFAULT_CONFIG.get(key, default))
 
+    def read_key(self, key: str, default=None):
+        """Read a single value without keeping the whole config loaded."""
+        if self._config is not None:
+            return self.get(key, default)
+        data = self._read() or {}
+        return data.get(key, self.DEFAULT_CONFIG.get(key, default))
+
     def set(self, key: str, value):
         """Set a configuration value."""
         self.config[key] = value
-        self._save()
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def set_deferred(self, key: str, value):
+        """Set a configuration value without writing; call flush() later."""
+        if self.config.get(key) == value:
+            return
+        self.config[key] = value
+        self._dirty = True
 
     @property
     def brightness(self) -> int:
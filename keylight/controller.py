@@ -3,9 +3,11 @@ Keyboard backlight hardware controller.
 Interfaces with /sys/class/leds/rgb:kbd_backlight
 """
 
+import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 
 class KeyboardBacklightController:
@@ -13,8 +15,32 @@ class KeyboardBacklightController:
 
     LED_PATH = Path("/sys/class/leds/rgb:kbd_backlight")
 
+    # Root helper for systems where sysfs isn't user-writable. Reads
+    # "<file> <value>" lines, only writes the known LED attributes and
+    # answers each line with "ok" or "fail". Packages install it with a
+    # polkit action so the prompt names KeyLight; otherwise the same loop
+    # runs through "sh -c".
+    PKEXEC_HELPER = "/usr/libexec/keylight/keylight-writer"
+    PKEXEC_WRITER = (
+        'while read -r f v; do '
+        'case "$f" in brightness|multi_intensity) '
+        'if printf "%s" "$v" > "$1/$f"; then echo ok; else echo fail; fi ;; '
+        '*) echo fail ;; esac; '
+        'done'
+    )
+
     def __init__(self):
         self._check_available()
+        # Resolve sysfs paths once to plain strings for the raw I/O calls
+        self._paths = {
+            name: str(self.LED_PATH / name)
+            for name in ("brightness", "max_brightness", "multi_intensity")
+        }
+        self._max_brightness: Optional[int] = None
+        self._needs_pkexec = False
+        self._pkexec_proc: Optional[subprocess.Popen] = None
+        self._pkexec_denied = False
+        self._pkexec_lock = threading.Lock()
 
     def _check_available(self) -> bool:
         """Check if keyboard backlight is available."""
@@ -24,34 +50,87 @@ class KeyboardBacklightController:
     def _read_file(self, filename: str) -> Optional[str]:
         """Read a sysfs file."""
         try:
-            return (self.LED_PATH / filename).read_text().strip()
+            with open(self._paths[filename], "rb") as f:
+                return f.read().strip().decode()
         except (PermissionError, FileNotFoundError, IOError):
             return None
 
-    def _write_file(self, filename: str, value: str) -> bool:
+    def _write_file(self, filename: str, value: bytes) -> bool:
         """Write to a sysfs file."""
-        filepath = self.LED_PATH / filename
+        if self._needs_pkexec:
+            return self._write_privileged(filename, value)
         try:
-            filepath.write_text(value)
+            fd = os.open(self._paths[filename], os.O_WRONLY)
+            try:
+                os.write(fd, value)
+            finally:
+                os.close(fd)
             return True
-        except (PermissionError, IOError):
-            # Try with pkexec for permission elevation
+        except PermissionError:
+            # Remember the result so later writes go straight to pkexec
+            self._needs_pkexec = True
+            return self._write_privileged(filename, value)
+        except IOError:
+            return False
+
+    def _write_privileged(self, filename: str, value: bytes) -> bool:
+        """Write through a long-lived pkexec helper process.
+
+        The helper is started (and authorized) once and then fed
+        "<file> <value>" lines, so effects don't spawn pkexec per frame.
+        Each write waits for the helper's reply, so a denied or cancelled
+        authorization (the helper exits) or a failed write returns False.
+        After a denial no new prompt is shown until retry_privileged().
+        """
+        with self._pkexec_lock:
+            proc = self._pkexec_proc
+            if proc is None or proc.poll() is not None:
+                if self._pkexec_denied:
+                    return False
+                if os.access(self.PKEXEC_HELPER, os.X_OK):
+                    argv = ["pkexec", self.PKEXEC_HELPER]
+                else:
+                    argv = ["pkexec", "sh", "-c", self.PKEXEC_WRITER,
+                            "keylight-writer", str(self.LED_PATH)]
+                try:
+                    proc = subprocess.Popen(
+                        argv,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL
+                    )
+                except OSError:
+                    return False
+                self._pkexec_proc = proc
             try:
-                subprocess.run(
-                    ["pkexec", "tee", str(filepath)],
-                    input=value.encode(),
-                    capture_output=True,
-                    check=True
-                )
-                return True
-            except subprocess.CalledProcessError:
+                proc.stdin.write(filename.encode() + b" " + value + b"\n")
+                proc.stdin.flush()
+                reply = proc.stdout.readline()
+            except OSError:
+                reply = b""
+            if not reply:
+                # Helper exited (e.g. authorization denied); don't prompt
+                # again for every effect frame or queued write
+                self._pkexec_proc = None
+                self._pkexec_denied = True
                 return False
+            return reply == b"ok\n"
+
+    def retry_privileged(self):
+        """Allow a new pkexec prompt after a denial.
+
+        Call this on explicit user actions, so cancelling the prompt stops
+        the writes of a running effect but the next click asks again.
+        """
+        self._pkexec_denied = False
 
     @property
     def max_brightness(self) -> int:
-        """Get maximum brightness value."""
-        val = self._read_file("max_brightness")
-        return int(val) if val else 255
+        """Get maximum brightness value (read once, it is hardware-constant)."""
+        if self._max_brightness is None:
+            val = self._read_file("max_brightness")
+            self._max_brightness = int(val) if val else 255
+        return self._max_brightness
 
     @property
     def brightness(self) -> int:
@@ -63,7 +142,7 @@ class KeyboardBacklightController:
     def brightness(self, value: int):
         """Set brightness (0-255)."""
         value = max(0, min(self.max_brightness, value))
-        self._write_file("brightness", str(value))
+        self._write_file("brightness", b"%d" % value)
 
     @property
     def color(self) -> Tuple[int, int, int]:
@@ -79,18 +158,25 @@ class KeyboardBacklightController:
     def color(self, rgb: Tuple[int, int, int]):
         """Set RGB color."""
         r, g, b = rgb
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        self._write_file("multi_intensity", f"{r} {g} {b}")
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            r = max(0, min(255, r))
+            g = max(0, min(255, g))
+            b = max(0, min(255, b))
+        self._write_file("multi_intensity", b"%d %d %d" % (r, g, b))
+
+    def set_color_unchecked(self, r: int, g: int, b: int):
+        """Set RGB color without clamping (channels must already be 0-255)."""
+        self._write_file("multi_intensity", b"%d %d %d" % (r, g, b))
+
+    def set_color_payload(self, payload: bytes):
+        """Write a preformatted b"r g b" payload (e.g. from a frame table)."""
+        self._write_file("multi_intensity", payload)
 
     def set_color_hex(self, hex_color: str):
         """Set color from hex string (e.g., '#FF0000' or 'FF0000')."""
         hex_color = hex_color.lstrip('#')
         if len(hex_color) == 6:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
+            r, g, b = bytes.fromhex(hex_color)
             self.color = (r, g, b)
 
     def get_color_hex(self) -> str:
@@ -117,15 +203,13 @@ class KeyboardBacklightController:
 
     def cycle_color(self, colors: list) -> int:
         """Cycle through a list of colors. Returns new color index."""
-        current = self.get_color_hex().upper()
-        colors_upper = [c.upper().lstrip('#') for c in colors]
-        current_clean = current.lstrip('#')
+        # Normalized hex -> first index (callers cycle once per process)
+        index: Dict[str, int] = {}
+        for i, c in enumerate(colors):
+            index.setdefault(c.upper().lstrip('#'), i)
 
-        try:
-            idx = colors_upper.index(current_clean)
-            next_idx = (idx + 1) % len(colors)
-        except ValueError:
-            next_idx = 0
+        current = self.get_color_hex().lstrip('#')
+        next_idx = (index.get(current, -1) + 1) % len(colors)
 
         self.set_color_hex(colors[next_idx])
         return next_idx
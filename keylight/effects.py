@@ -2,6 +2,8 @@
 Keyboard backlight effects and animations.
 """
 
+import queue
+import random
 import threading
 import time
 import math
@@ -15,12 +17,46 @@ class EffectEngine:
     def __init__(self, controller: KeyboardBacklightController):
         self.controller = controller
         self._running = False
-        self._thread: Optional[threading.Thread] = None
         self._current_effect = "static"
         self._speed = 50  # 0-100
         self._colors: List[str] = []
         self._on_color_change: Optional[Callable] = None
 
+        # One reusable worker runs effect loops; a loop keeps going only
+        # while the generation it was started with is still current.
+        self._generation = 0
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+    def _worker_loop(self):
+        """Run queued effect loops one after another."""
+        while True:
+            gen, loop, args = self._queue.get()
+            if gen != self._generation:
+                continue  # Superseded before it started
+            self._idle.clear()
+            try:
+                loop(gen, *args)
+            except Exception as e:
+                # A failing effect must not take the worker down
+                print(f"Effect error: {e}")
+            finally:
+                if gen == self._generation:
+                    # Ended on its own (error or no frames), not via stop()
+                    self._running = False
+                self._idle.set()
+
+    def _submit(self, effect: str, loop: Callable, *args):
+        """Queue an effect loop on the worker (call stop() first)."""
+        self._current_effect = effect
+        self._running = True
+        self._wakeup.clear()
+        self._queue.put((self._generation, loop, args))
+
     def set_callback(self, callback: Callable):
         """Set callback for color changes (for UI updates)."""
         self._on_color_change = callback
@@ -30,7 +66,7 @@ class EffectEngine:
         if self._on_color_change:
             try:
                 self._on_color_change(r, g, b)
-            except:
+            except Exception:
                 pass
 
     @property
@@ -52,9 +88,11 @@ class EffectEngine:
     def stop(self):
         """Stop any running effect."""
         self._running = False
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
-        self._thread = None
+        self._generation += 1
+        self._wakeup.set()
+        if threading.current_thread() is not self._worker:
+            # Wait for the loop to return so it can't write after us
+            self._idle.wait(timeout=1.0)
         self._current_effect = "static"
 
     def _get_delay(self) -> float:
@@ -62,69 +100,88 @@ class EffectEngine:
         # Speed 1 = 0.2s delay, Speed 100 = 0.01s delay
         return 0.2 - (self._speed / 100) * 0.19
 
+    def _pace(self, deadline: float, period: float) -> float:
+        """Sleep until one period after the last frame deadline.
+
+        Returns the new deadline. Frames are scheduled against
+        time.perf_counter() so compute and write time don't add drift;
+        if the loop has fallen more than a period behind, missed frames
+        are dropped and the schedule restarts from now.
+        """
+        deadline += period
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            self._wakeup.wait(remaining)  # Returns early on stop()
+        elif remaining < -period:
+            deadline = time.perf_counter()
+        return deadline
+
+    def _base_rgb(self, color: Optional[str]) -> tuple:
+        """Resolve the base color for single-color effects as (r, g, b).
+
+        Uses the given color, else the remembered one, else the current
+        hardware color (read as RGB, without a hex round-trip).
+        """
+        if color:
+            self._colors = [color]
+        elif not self._colors:
+            rgb = self.controller.color
+            self._colors = ["#%02X%02X%02X" % rgb]
+            return rgb
+        return self._hex_to_rgb(self._colors[0])
+
     def start_rainbow(self):
         """Start rainbow color cycling effect."""
         self.stop()
-        self._current_effect = "rainbow"
-        self._running = True
-        self._thread = threading.Thread(target=self._rainbow_loop, daemon=True)
-        self._thread.start()
-
-    def _rainbow_loop(self):
+        self._submit("rainbow", self._rainbow_loop)
+
+    def _play_frames(self, gen: int, frames: tuple):
+        """Loop over precomputed (r, g, b) frames until stopped.
+
+        Shared kernel for the table-driven effects. Each frame's sysfs
+        payload is encoded once up front, so a frame is just a write.
+        """
+        payloads = [b"%d %d %d" % frame for frame in frames]
+        n = len(frames)
+        # Bound once so frames skip the attribute lookups
+        write_payload = self.controller.set_color_payload
+        notify = self._notify_color_change
+
+        i = 0
+        deadline = time.perf_counter()
+        while gen == self._generation:
+            write_payload(payloads[i])
+            notify(*frames[i])
+
+            i = (i + 1) % n
+            deadline = self._pace(deadline, self._get_delay())
+
+    def _rainbow_loop(self, gen: int):
         """Rainbow effect loop - cycles through HSV hue."""
-        hue = 0
-        while self._running:
-            # Convert HSV to RGB (S=1, V=1)
-            r, g, b = self._hsv_to_rgb(hue, 1.0, 1.0)
-            self.controller.color = (r, g, b)
-            self._notify_color_change(r, g, b)
-
-            hue = (hue + 2) % 360  # Increment hue
-            time.sleep(self._get_delay())
+        self._play_frames(gen, _RAINBOW_LUT)
 
-    def start_breathing(self, color: str = None):
+    def start_breathing(self, color: Optional[str] = None):
         """Start breathing effect (fade in/out)."""
         self.stop()
-        self._current_effect = "breathing"
-        self._running = True
-
-        if color:
-            self._colors = [color]
-        elif not self._colors:
-            self._colors = [self.controller.get_color_hex()]
+        self._submit("breathing", self._breathing_loop, self._base_rgb(color))
 
-        self._thread = threading.Thread(target=self._breathing_loop, daemon=True)
-        self._thread.start()
-
-    def _breathing_loop(self):
+    def _breathing_loop(self, gen: int, rgb: tuple):
         """Breathing effect loop."""
-        base_color = self._colors[0] if self._colors else "#FFFFFF"
-        r, g, b = self._hex_to_rgb(base_color)
+        self._play_frames(gen, self._breathing_frames(*rgb))
 
-        phase = 0
-        while self._running:
+    @staticmethod
+    def _breathing_frames(r: int, g: int, b: int) -> tuple:
+        """Precompute one breathing period (phase 0 to 2*pi in 0.1 steps)."""
+        frames = []
+        for k in range(int(2 * math.pi / 0.1) + 1):
             # Sine wave for smooth breathing (0 to 1)
-            brightness = (math.sin(phase) + 1) / 2
-
-            # Apply brightness to color
-            cr = int(r * brightness)
-            cg = int(g * brightness)
-            cb = int(b * brightness)
-
-            self.controller.color = (cr, cg, cb)
-            self._notify_color_change(cr, cg, cb)
-
-            phase += 0.1
-            if phase > 2 * math.pi:
-                phase = 0
-
-            time.sleep(self._get_delay())
+            brightness = (math.sin(k * 0.1) + 1) / 2
+            frames.append((int(r * brightness), int(g * brightness), int(b * brightness)))
+        return tuple(frames)
 
     def start_color_wave(self, colors: List[str] = None):
         """Start color wave effect - cycles through multiple colors."""
         self.stop()
-        self._current_effect = "wave"
-        self._running = True
 
         if colors:
             self._colors = colors
@@ -132,152 +189,144 @@ class EffectEngine:
             self._colors = ["#FF0000", "#FF8000", "#FFFF00", "#00FF00",
                            "#00FFFF", "#0000FF", "#8000FF", "#FF00FF"]
 
-        self._thread = threading.Thread(target=self._wave_loop, daemon=True)
-        self._thread.start()
+        self._submit("wave", self._wave_loop)
 
-    def _wave_loop(self):
+    def _wave_loop(self, gen: int):
         """Color wave effect loop with smooth transitions."""
         colors = [self._hex_to_rgb(c) for c in self._colors]
         if not colors:
             return
 
-        color_idx = 0
-        transition_progress = 0.0
-
-        while self._running:
-            # Get current and next color
-            current = colors[color_idx]
-            next_color = colors[(color_idx + 1) % len(colors)]
-
-            # Interpolate between colors
-            r = int(current[0] + (next_color[0] - current[0]) * transition_progress)
-            g = int(current[1] + (next_color[1] - current[1]) * transition_progress)
-            b = int(current[2] + (next_color[2] - current[2]) * transition_progress)
-
-            self.controller.color = (r, g, b)
-            self._notify_color_change(r, g, b)
+        self._play_frames(gen, self._wave_frames(colors))
 
-            transition_progress += 0.02
-            if transition_progress >= 1.0:
-                transition_progress = 0.0
-                color_idx = (color_idx + 1) % len(colors)
-
-            time.sleep(self._get_delay())
-
-    def start_strobe(self, color: str = None):
+    @staticmethod
+    def _wave_frames(colors: List[tuple]) -> tuple:
+        """Precompute 50 interpolation steps between each pair of colors."""
+        frames = []
+        for idx, current in enumerate(colors):
+            next_color = colors[(idx + 1) % len(colors)]
+            for step in range(50):
+                t = step * 0.02
+                frames.append((
+                    int(current[0] + (next_color[0] - current[0]) * t),
+                    int(current[1] + (next_color[1] - current[1]) * t),
+                    int(current[2] + (next_color[2] - current[2]) * t),
+                ))
+        return tuple(frames)
+
+    def start_strobe(self, color: Optional[str] = None):
         """Start strobe/flash effect."""
         self.stop()
-        self._current_effect = "strobe"
-        self._running = True
-
-        if color:
-            self._colors = [color]
-        elif not self._colors:
-            self._colors = [self.controller.get_color_hex()]
+        self._submit("strobe", self._strobe_loop, self._base_rgb(color))
 
-        self._thread = threading.Thread(target=self._strobe_loop, daemon=True)
-        self._thread.start()
-
-    def _strobe_loop(self):
+    def _strobe_loop(self, gen: int, rgb: tuple):
         """Strobe effect loop."""
-        base_color = self._colors[0] if self._colors else "#FFFFFF"
-        r, g, b = self._hex_to_rgb(base_color)
+        r, g, b = rgb
         on = True
+        write_color = self.controller.set_color_unchecked
+        notify = self._notify_color_change
 
-        while self._running:
+        deadline = time.perf_counter()
+        while gen == self._generation:
             if on:
-                self.controller.color = (r, g, b)
-                self._notify_color_change(r, g, b)
+                write_color(r, g, b)
+                notify(r, g, b)
             else:
-                self.controller.color = (0, 0, 0)
-                self._notify_color_change(0, 0, 0)
+                write_color(0, 0, 0)
+                notify(0, 0, 0)
 
             on = not on
-            time.sleep(self._get_delay() * 2)
+            deadline = self._pace(deadline, self._get_delay() * 2)
 
     def start_candle(self):
         """Start candle flicker effect."""
         self.stop()
-        self._current_effect = "candle"
-        self._running = True
-        self._thread = threading.Thread(target=self._candle_loop, daemon=True)
-        self._thread.start()
+        self._submit("candle", self._candle_loop)
 
-    def _candle_loop(self):
+    def _candle_loop(self, gen: int):
         """Candle flicker effect - warm orange with random flicker."""
-        import random
+        # Base warm color (orange/yellow), blue halved
+        base_r, base_g, base_b = 255, 147, 41 * 0.5
 
-        while self._running:
-            # Base warm color (orange/yellow)
-            base_r, base_g, base_b = 255, 147, 41
+        # Ring buffers of random flicker intensities and delays, refilled
+        # every 4096 frames from a private RNG (no global RNG lock)
+        rng = random.Random()
+        flicker_buf = [rng.uniform(0.7, 1.0) for _ in range(4096)]
+        delay_buf = [rng.uniform(0.05, 0.15) for _ in range(4096)]
 
-            # Random flicker intensity
-            flicker = random.uniform(0.7, 1.0)
+        write_color = self.controller.set_color_unchecked
+        notify = self._notify_color_change
+
+        i = 0
+        deadline = time.perf_counter()
+        while gen == self._generation:
+            flicker = flicker_buf[i]
 
             r = int(base_r * flicker)
             g = int(base_g * flicker)
-            b = int(base_b * flicker * 0.5)
+            b = int(base_b * flicker)
 
-            self.controller.color = (r, g, b)
-            self._notify_color_change(r, g, b)
+            write_color(r, g, b)
+            notify(r, g, b)
 
             # Random delay for natural flicker
-            time.sleep(random.uniform(0.05, 0.15))
+            deadline = self._pace(deadline, delay_buf[i])
+
+            i = (i + 1) & 4095
+            if i == 0:
+                flicker_buf[:] = [rng.uniform(0.7, 1.0) for _ in range(4096)]
+                delay_buf[:] = [rng.uniform(0.05, 0.15) for _ in range(4096)]
 
     def start_police(self):
         """Start police lights effect (red/blue flash)."""
         self.stop()
-        self._current_effect = "police"
-        self._running = True
-        self._thread = threading.Thread(target=self._police_loop, daemon=True)
-        self._thread.start()
+        self._submit("police", self._police_loop)
 
-    def _police_loop(self):
+    def _police_loop(self, gen: int):
         """Police lights effect loop."""
         colors = [(255, 0, 0), (0, 0, 255)]
         idx = 0
         flash_count = 0
+        write_color = self.controller.set_color_unchecked
+        notify = self._notify_color_change
 
-        while self._running:
+        while gen == self._generation:
             r, g, b = colors[idx]
-            self.controller.color = (r, g, b)
-            self._notify_color_change(r, g, b)
-            time.sleep(0.1)
+            write_color(r, g, b)
+            notify(r, g, b)
+            self._wakeup.wait(0.1)
 
-            self.controller.color = (0, 0, 0)
-            self._notify_color_change(0, 0, 0)
-            time.sleep(0.05)
+            write_color(0, 0, 0)
+            notify(0, 0, 0)
+            self._wakeup.wait(0.05)
 
             flash_count += 1
             if flash_count >= 3:
                 flash_count = 0
                 idx = (idx + 1) % 2
-                time.sleep(0.1)
+                self._wakeup.wait(0.1)
 
     @staticmethod
     def _hsv_to_rgb(h: float, s: float, v: float) -> tuple:
         """Convert HSV to RGB (h: 0-360, s: 0-1, v: 0-1)."""
-        c = v * s
-        x = c * (1 - abs((h / 60) % 2 - 1))
-        m = v - c
-
-        if h < 60:
-            r, g, b = c, x, 0
-        elif h < 120:
-            r, g, b = x, c, 0
-        elif h < 180:
-            r, g, b = 0, c, x
-        elif h < 240:
-            r, g, b = 0, x, c
-        elif h < 300:
-            r, g, b = x, 0, c
-        else:
-            r, g, b = c, 0, x
-
-        return (int((r + m) * 255), int((g + m) * 255), int((b + m) * 255))
+        # Branchless sector form: f(n) = v - v*s*max(0, min(k, 4-k, 1)),
+        # with k = (n + h/60) mod 6 and n = 5, 3, 1 for r, g, b
+        h60 = h / 60
+        vs = v * s
+        kr = (5 + h60) % 6
+        kg = (3 + h60) % 6
+        kb = (1 + h60) % 6
+        r = v - vs * max(0, min(kr, 4 - kr, 1))
+        g = v - vs * max(0, min(kg, 4 - kg, 1))
+        b = v - vs * max(0, min(kb, 4 - kb, 1))
+        return (int(r * 255), int(g * 255), int(b * 255))
 
     @staticmethod
     def _hex_to_rgb(hex_color: str) -> tuple:
         """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        rgb = bytes.fromhex(hex_color.lstrip('#'))
+        return (rgb[0], rgb[1], rgb[2])
+
+
+# Rainbow colors for hues 0, 2, ..., 358 (S=1, V=1), precomputed once
+_RAINBOW_LUT = tuple(EffectEngine._hsv_to_rgb(h, 1.0, 1.0) for h in range(0, 360, 2))
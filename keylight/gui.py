@@ -6,68 +6,241 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, Gdk, GLib, Gio
 import cairo
+import threading
+from functools import lru_cache
+from typing import List, Optional, Set
 
 from .controller import KeyboardBacklightController
 from .config import Config
 from .effects import EffectEngine
+from .watcher import BacklightWatcher
+
+
+# Main window stylesheet, shared by every KeyLightWindow
+_WINDOW_CSS_BYTES = b"""
+window {
+    background: #1a1a2e;
+}
+.main-container {
+    padding: 16px;
+}
+.title-label {
+    font-size: 20px;
+    font-weight: bold;
+    color: white;
+}
+.subtitle-label {
+    font-size: 11px;
+    color: #888;
+}
+.section-label {
+    font-size: 12px;
+    font-weight: bold;
+    color: #666;
+    margin-top: 8px;
+}
+.color-preview {
+    border-radius: 10px;
+    border: 2px solid rgba(255,255,255,0.15);
+}
+scale {
+    padding: 0;
+}
+scale trough {
+    background: #333;
+    border-radius: 4px;
+    min-height: 6px;
+}
+scale highlight {
+    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    border-radius: 4px;
+}
+scale slider {
+    background: white;
+    border-radius: 50%;
+    min-width: 16px;
+    min-height: 16px;
+}
+button.toggle-btn {
+    background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
+    border: none;
+    border-radius: 20px;
+    padding: 10px 24px;
+    font-size: 13px;
+    font-weight: bold;
+    color: white;
+}
+button.toggle-btn:hover {
+    background: linear-gradient(180deg, #764ba2 0%, #667eea 100%);
+}
+button.toggle-btn.off {
+    background: #333;
+}
+combobox button {
+    background: #2a2a3e;
+    border: 1px solid #444;
+    border-radius: 6px;
+    color: white;
+    padding: 6px 12px;
+}
+combobox button:hover {
+    border-color: #667eea;
+}
+.info-label {
+    color: #555;
+    font-size: 10px;
+}
+"""
+
+_window_provider: Optional[Gtk.CssProvider] = None
+
+# Scales a 0-255 channel times a 0-255 brightness to cairo's 0-1 range
+_INV_255_SQUARED = 1.0 / (255 * 255)
+
+# Size of the favorite color buttons
+_COLOR_BTN_SIZE = 36
+
+# Color button styles: shared base rules plus one rule per color
+_COLOR_BTN_BASE_CSS = b"""
+button.color-button {
+    border-radius: 6px;
+    border: 2px solid rgba(255,255,255,0.2);
+    min-width: 36px;
+    min-height: 36px;
+    padding: 0;
+}
+button.color-button:hover {
+    border: 2px solid white;
+}
+"""
+_COLOR_BTN_CSS = b"button.cb-%s { background: #%s; }\n"
+
+
+@lru_cache(maxsize=64)
+def _parse_rgba(hex_color: str) -> Gdk.RGBA:
+    """Parse a hex color into a cached Gdk.RGBA (set_rgba copies it)."""
+    rgba = Gdk.RGBA()
+    rgba.parse(hex_color)
+    return rgba
 
 
 class ColorButton(Gtk.Button):
     """A button that displays and sets a color."""
 
-    def __init__(self, color: str, size: int = 36):
+    # One screen-wide provider shared by all color buttons, holding one
+    # rule per distinct color, instead of a provider per button.
+    _provider: Optional[Gtk.CssProvider] = None
+    _known_colors: Set[str] = set()
+    _css_rules: List[bytes] = [_COLOR_BTN_BASE_CSS]
+
+    def __init__(self, color: str, size: int = _COLOR_BTN_SIZE):
         super().__init__()
         self.color = color
         self.set_size_request(size, size)
         self.set_tooltip_text(color)
         self._update_style()
 
+    @staticmethod
+    def _css_class(color: str) -> str:
+        return "cb-" + color.lstrip('#').upper()
+
+    @classmethod
+    def preload(cls, colors: List[str]):
+        """Register CSS for several colors with a single provider reload."""
+        if cls._provider is None:
+            cls._provider = Gtk.CssProvider()
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                cls._provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+
+        added = False
+        for color in colors:
+            hex_id = color.lstrip('#').upper()
+            if hex_id not in cls._known_colors:
+                cls._known_colors.add(hex_id)
+                hex_bytes = hex_id.encode()
+                cls._css_rules.append(_COLOR_BTN_CSS % (hex_bytes, hex_bytes))
+                added = True
+        if added:
+            cls._provider.load_from_data(b"".join(cls._css_rules))
+
     def _update_style(self):
         """Update button appearance."""
-        css = f"""
-        button {{
-            background: {self.color};
-            border-radius: 6px;
-            border: 2px solid rgba(255,255,255,0.2);
-            min-width: 36px;
-            min-height: 36px;
-            padding: 0;
-        }}
-        button:hover {{
-            border: 2px solid white;
-        }}
-        """
-        provider = Gtk.CssProvider()
-        provider.load_from_data(css.encode())
-        self.get_style_context().add_provider(
-            provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        self.preload([self.color])
+        ctx = self.get_style_context()
+        ctx.add_class("color-button")
+        ctx.add_class(self._css_class(self.color))
 
 
 class KeyLightWindow(Gtk.ApplicationWindow):
     """Main application window."""
 
+    # Effect dropdown entries (id, label, EffectEngine start method); the
+    # combo box and the dispatch table are both built from this one list
+    _EFFECTS = (
+        ("static", "Static", None),
+        ("rainbow", "Rainbow", EffectEngine.start_rainbow),
+        ("breathing", "Breathing", EffectEngine.start_breathing),
+        ("wave", "Color Wave", EffectEngine.start_color_wave),
+        ("strobe", "Strobe", EffectEngine.start_strobe),
+        ("candle", "Candle", EffectEngine.start_candle),
+        ("police", "Police", EffectEngine.start_police),
+    )
+
+    # Effect id -> EffectEngine start method
+    _EFFECT_STARTERS = {
+        effect_id: start for effect_id, _, start in _EFFECTS if start
+    }
+
     def __init__(self, app):
         super().__init__(application=app, title="KeyLight")
         self.app = app
         self.controller = KeyboardBacklightController()
         self.config = Config()
-        self.effects = EffectEngine(self.controller)
-        self.effects.set_callback(self._on_effect_color_change)
-
-        # Window settings
-        self.set_default_size(380, 480)
-        self.set_size_request(320, 400)  # Minimum size
-        self.set_position(Gtk.WindowPosition.CENTER)
-
-        # Restore window size from config
+        # Created on first effect selection, so no worker thread runs
+        # while the backlight is static
+        self.effects: Optional[EffectEngine] = None
+
+        # Cached color preview outline and border, rebuilt on resize
+        self._preview_path = None
+        self._preview_border = None
+        self._preview_size = (0, 0, 0)
+        self._preview_dirty = False
+        self._frame_source = 0
+        self._draw_source = 0
+
+        # Latest effect frame, handed from the effect thread to the frame clock
+        self._preview_lock = threading.Lock()
+        self._latest_rgb: Optional[tuple] = None
+        self._preview_rgb: Optional[tuple] = None
+
+        # Pending GLib sources for debounced slider and resize handling
+        self._pending_brightness = 0
+        self._brightness_source = 0
+        self._brightness_dragging = False
+        self._resize_source = 0
+        self._last_size = (0, 0)
+        self._last_resize_time = 0
+        self._config_source = 0
+
+        # Window settings, default size restored from config
         saved_width = self.config.get("window_width", 380)
         saved_height = self.config.get("window_height", 480)
         self.set_default_size(saved_width, saved_height)
+        self.set_size_request(320, 400)  # Minimum size
+        self.set_position(Gtk.WindowPosition.CENTER)
 
         # Save size on resize
         self.connect("configure-event", self._on_window_resize)
 
+        # Restart the preview frame clock when shown again from the tray
+        self.connect("show", self._on_show)
+
+        # Drop pending timers when the window goes away
+        self.connect("destroy", self._on_destroy)
+
         # Apply dark theme
         settings = Gtk.Settings.get_default()
         settings.set_property("gtk-application-prefer-dark-theme", True)
@@ -81,108 +254,38 @@ class KeyLightWindow(Gtk.ApplicationWindow):
         # Load saved state
         self._restore_state()
 
+        # Follow changes made outside the window (shortcuts, CLI)
+        self._hw_state = None
+        self.watcher = BacklightWatcher(self.controller, self._on_backlight_event)
+        self.watcher.start()
+
         # Show all widgets
         self.show_all()
 
     def _apply_css(self):
-        """Apply custom CSS styling."""
-        css = """
-        window {
-            background: #1a1a2e;
-        }
-        .main-container {
-            padding: 16px;
-        }
-        .title-label {
-            font-size: 20px;
-            font-weight: bold;
-            color: white;
-        }
-        .subtitle-label {
-            font-size: 11px;
-            color: #888;
-        }
-        .section-label {
-            font-size: 12px;
-            font-weight: bold;
-            color: #666;
-            margin-top: 8px;
-        }
-        .color-preview {
-            border-radius: 10px;
-            border: 2px solid rgba(255,255,255,0.15);
-        }
-        scale {
-            padding: 0;
-        }
-        scale trough {
-            background: #333;
-            border-radius: 4px;
-            min-height: 6px;
-        }
-        scale highlight {
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-            border-radius: 4px;
-        }
-        scale slider {
-            background: white;
-            border-radius: 50%;
-            min-width: 16px;
-            min-height: 16px;
-        }
-        button.toggle-btn {
-            background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
-            border: none;
-            border-radius: 20px;
-            padding: 10px 24px;
-            font-size: 13px;
-            font-weight: bold;
-            color: white;
-        }
-        button.toggle-btn:hover {
-            background: linear-gradient(180deg, #764ba2 0%, #667eea 100%);
-        }
-        button.toggle-btn.off {
-            background: #333;
-        }
-        combobox button {
-            background: #2a2a3e;
-            border: 1px solid #444;
-            border-radius: 6px;
-            color: white;
-            padding: 6px 12px;
-        }
-        combobox button:hover {
-            border-color: #667eea;
-        }
-        .info-label {
-            color: #555;
-            font-size: 10px;
-        }
-        """
-        provider = Gtk.CssProvider()
-        provider.load_from_data(css.encode())
+        """Apply custom CSS styling (parsed and attached once per process)."""
+        global _window_provider
+        if _window_provider is not None:
+            return
+        _window_provider = Gtk.CssProvider()
+        _window_provider.load_from_data(_WINDOW_CSS_BYTES)
         Gtk.StyleContext.add_provider_for_screen(
             Gdk.Screen.get_default(),
-            provider,
+            _window_provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
 
     def _build_ui(self):
         """Build the user interface."""
-        # Scrolled window for responsiveness
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        self.add(scrolled)
-
-        # Main container
+        # Main container (added directly; the layout fits the minimum size,
+        # so a ScrolledWindow would only add an extra viewport to allocate)
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         main_box.get_style_context().add_class("main-container")
         main_box.set_margin_top(16)
         main_box.set_margin_bottom(16)
         main_box.set_margin_start(20)
         main_box.set_margin_end(20)
-        scrolled.add(main_box)
+        self.add(main_box)
 
         # Header
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
@@ -203,7 +306,9 @@ class KeyLightWindow(Gtk.ApplicationWindow):
         # Toggle button in header
         self.toggle_btn = Gtk.Button(label="ON")
         self.toggle_btn.set_size_request(60, 36)
-        self.toggle_btn.get_style_context().add_class("toggle-btn")
+        self._toggle_ctx = self.toggle_btn.get_style_context()
+        self._toggle_ctx.add_class("toggle-btn")
+        self._toggle_on: Optional[bool] = None
         self.toggle_btn.connect("clicked", self._on_toggle_clicked)
         header_box.pack_end(self.toggle_btn, False, False, 0)
 
@@ -224,13 +329,20 @@ class KeyLightWindow(Gtk.ApplicationWindow):
         brightness_label.get_style_context().add_class("section-label")
         brightness_box.pack_start(brightness_label, False, False, 0)
 
-        self.brightness_scale = Gtk.Scale.new_with_range(
-            Gtk.Orientation.HORIZONTAL, 0, 255, 1
+        # Coarser steps for keys/scroll; drags persist only on release
+        adjustment = Gtk.Adjustment(
+            value=self.controller.brightness, lower=0, upper=255,
+            step_increment=4, page_increment=32, page_size=0
         )
-        self.brightness_scale.set_value(self.controller.brightness)
+        self.brightness_scale = Gtk.Scale(
+            orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment
+        )
+        self.brightness_scale.set_digits(0)
         self.brightness_scale.set_draw_value(False)
         self.brightness_scale.set_hexpand(True)
         self.brightness_scale.connect("value-changed", self._on_brightness_changed)
+        self.brightness_scale.connect("button-press-event", self._on_brightness_press)
+        self.brightness_scale.connect("button-release-event", self._on_brightness_release)
         brightness_box.pack_start(self.brightness_scale, True, True, 0)
 
         self.brightness_label = Gtk.Label(label="100%")
@@ -245,27 +357,40 @@ class KeyLightWindow(Gtk.ApplicationWindow):
         colors_label.get_style_context().add_class("section-label")
         main_box.pack_start(colors_label, False, False, 4)
 
-        # Color grid - 2 rows
-        color_grid = Gtk.Grid()
+        # Color grid - 2 rows of 5. Kept hidden while filling so its
+        # geometry is negotiated once, after all buttons are added.
+        color_grid = Gtk.FlowBox()
+        color_grid.set_min_children_per_line(5)
+        color_grid.set_max_children_per_line(5)
+        color_grid.set_selection_mode(Gtk.SelectionMode.NONE)
+        color_grid.set_homogeneous(True)
         color_grid.set_row_spacing(8)
         color_grid.set_column_spacing(8)
         color_grid.set_halign(Gtk.Align.CENTER)
+        color_grid.set_visible(False)
 
         colors = self.config.favorite_colors[:10]  # Max 10 colors
-        for i, color in enumerate(colors):
-            btn = ColorButton(color)
-            btn.connect("clicked", self._on_color_clicked, color)
-            color_grid.attach(btn, i % 5, i // 5, 1, 1)
-
+        ColorButton.preload(colors)
+        add = color_grid.add
+        on_clicked = self._on_color_clicked
+        for color in colors:
+            # Parsed once here so clicks don't re-parse the hex string
+            rgba = _parse_rgba(color)
+            rgb = (round(rgba.red * 255), round(rgba.green * 255),
+                   round(rgba.blue * 255))
+            btn = ColorButton(color, _COLOR_BTN_SIZE)
+            btn.connect("clicked", on_clicked, (color, rgba, rgb))
+            add(btn)
+
+        color_grid.set_visible(True)
+        color_grid.show_all()
         main_box.pack_start(color_grid, False, False, 4)
 
         # Custom color row
         custom_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
 
         self.color_button = Gtk.ColorButton()
-        current_color = Gdk.RGBA()
-        current_color.parse(self.controller.get_color_hex())
-        self.color_button.set_rgba(current_color)
+        self.color_button.set_rgba(_parse_rgba(self.controller.get_color_hex()))
         self.color_button.set_use_alpha(False)
         self.color_button.set_title("Choose Color")
         self.color_button.connect("color-set", self._on_custom_color_set)
@@ -287,17 +412,9 @@ class KeyLightWindow(Gtk.ApplicationWindow):
 
         # Effect dropdown
         self.effect_combo = Gtk.ComboBoxText()
-        effects_list = [
-            ("static", "Static"),
-            ("rainbow", "Rainbow"),
-            ("breathing", "Breathing"),
-            ("wave", "Color Wave"),
-            ("strobe", "Strobe"),
-            ("candle", "Candle"),
-            ("police", "Police"),
-        ]
-        for effect_id, effect_name in effects_list:
-            self.effect_combo.append(effect_id, effect_name)
+        append = self.effect_combo.append
+        for effect_id, effect_name, _ in self._EFFECTS:
+            append(effect_id, effect_name)
         self.effect_combo.set_active_id("static")
         self.effect_combo.connect("changed", self._on_effect_changed)
         self.effect_combo.set_hexpand(True)
@@ -333,8 +450,7 @@ class KeyLightWindow(Gtk.ApplicationWindow):
         main_box.pack_start(Gtk.Box(), True, True, 0)
 
         # Shortcut info
-        shortcut_info = Gtk.Label()
-        shortcut_info.set_markup('<span color="#555" size="small">Tip: Add keyboard shortcut for keylight-cycle</span>')
+        shortcut_info = Gtk.Label(label="Tip: Add keyboard shortcut for keylight-cycle")
         shortcut_info.get_style_context().add_class("info-label")
         main_box.pack_end(shortcut_info, False, False, 8)
 
@@ -346,38 +462,125 @@ class KeyLightWindow(Gtk.ApplicationWindow):
         width = widget.get_allocated_width()
         height = widget.get_allocated_height()
 
-        # Get current color
-        r, g, b = self.controller.color
-        brightness = self.controller.brightness / 255.0
-
-        # Apply brightness to color
-        r = int(r * brightness) / 255.0
-        g = int(g * brightness) / 255.0
-        b = int(b * brightness) / 255.0
+        # Rebuild the rounded rectangle path and border only when the
+        # size (or HiDPI scale) changes
+        scale_factor = widget.get_scale_factor()
+        if (width, height, scale_factor) != self._preview_size:
+            self._preview_path = self._build_preview_path(width, height)
+            self._preview_border = self._build_preview_border(
+                self._preview_path, width, height, scale_factor
+            )
+            self._preview_size = (width, height, scale_factor)
+
+        # Get current color and brightness. While an effect runs, use its
+        # latest frame and the slider (effects never change brightness),
+        # saving two sysfs reads per frame.
+        if self._preview_rgb is not None and self.effects and self.effects.is_running:
+            r, g, b = self._preview_rgb
+            brightness = int(self.brightness_scale.get_value())
+        else:
+            r, g, b = self.controller.color
+            brightness = self.controller.brightness
+        scale = brightness * _INV_255_SQUARED
 
-        # Draw rounded rectangle
-        radius = 10
         cr.new_path()
-        cr.arc(width - radius, radius, radius, -1.5708, 0)
-        cr.arc(width - radius, height - radius, radius, 0, 1.5708)
-        cr.arc(radius, height - radius, radius, 1.5708, 3.1416)
-        cr.arc(radius, radius, radius, 3.1416, 4.7124)
-        cr.close_path()
+        cr.append_path(self._preview_path)
 
         # Fill with color
-        cr.set_source_rgb(r, g, b)
-        cr.fill_preserve()
+        cr.set_source_rgb(r * scale, g * scale, b * scale)
+        cr.fill()
+
+        # Blit the pre-rendered border
+        cr.set_source_surface(self._preview_border, 0, 0)
+        cr.paint()
+
+    def _redraw_preview(self):
+        """Schedule a preview redraw; repeated requests share one idle."""
+        if not self._draw_source:
+            self._draw_source = GLib.idle_add(
+                self._flush_preview_redraw, priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+
+    def _flush_preview_redraw(self):
+        """Idle callback for _redraw_preview()."""
+        self._draw_source = 0
+        self._queue_preview_draw()
+        return False
 
-        # Draw border
-        cr.set_source_rgba(1, 1, 1, 0.15)
-        cr.set_line_width(2)
-        cr.stroke()
+    def _queue_preview_draw(self):
+        """Invalidate just the rounded preview rectangle."""
+        preview = self.color_preview
+        if not preview.get_mapped() or not self.get_visible():
+            return  # Hidden (e.g. closed to tray); nothing to redraw
+        preview.queue_draw_area(
+            0, 0, preview.get_allocated_width(), preview.get_allocated_height()
+        )
+
+    @staticmethod
+    def _build_preview_path(width: int, height: int):
+        """Build the rounded rectangle path for the color preview."""
+        surface = cairo.RecordingSurface(
+            cairo.CONTENT_ALPHA, cairo.Rectangle(0, 0, width, height)
+        )
+        ctx = cairo.Context(surface)
+
+        radius = 10
+        arc = ctx.arc
+        arc(width - radius, radius, radius, -1.5708, 0)
+        arc(width - radius, height - radius, radius, 0, 1.5708)
+        arc(radius, height - radius, radius, 1.5708, 3.1416)
+        arc(radius, radius, radius, 3.1416, 4.7124)
+        ctx.close_path()
+        return ctx.copy_path()
+
+    @staticmethod
+    def _build_preview_border(path, width: int, height: int, scale_factor: int):
+        """Rasterize the preview border once so draws only composite it."""
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, width * scale_factor, height * scale_factor
+        )
+        surface.set_device_scale(scale_factor, scale_factor)
+        ctx = cairo.Context(surface)
+        ctx.append_path(path)
+        ctx.set_source_rgba(1, 1, 1, 0.15)
+        ctx.set_line_width(2)
+        ctx.stroke()
+        return surface
 
     def _on_window_resize(self, widget, event):
-        """Save window size on resize."""
-        width, height = self.get_size()
-        self.config.set("window_width", width)
-        self.config.set("window_height", height)
+        """Save window size on resize (trailing-edge debounced)."""
+        # configure-event fires for every pixel of a drag; just record the
+        # size here and let one timer save it once resizing has settled.
+        self._last_size = self.get_size()
+        self._last_resize_time = GLib.get_monotonic_time()
+        if not self._resize_source:
+            self._resize_source = GLib.timeout_add(250, self._flush_resize)
+
+    def _flush_resize(self):
+        """Persist the window size 250 ms after the last configure-event."""
+        idle_ms = (GLib.get_monotonic_time() - self._last_resize_time) // 1000
+        if idle_ms < 250:
+            self._resize_source = GLib.timeout_add(250 - idle_ms, self._flush_resize)
+            return False
+
+        self._resize_source = 0
+        width, height = self._last_size
+        with self.config:
+            self.config.set("window_width", width)
+            self.config.set("window_height", height)
+        return False
+
+    def _set_config(self, key: str, value):
+        """Store a config value; the file is written once changes settle."""
+        self.config.set_deferred(key, value)
+        if not self._config_source:
+            self._config_source = GLib.timeout_add(500, self._flush_config)
+
+    def _flush_config(self):
+        """Write deferred config changes to disk."""
+        self._config_source = 0
+        self.config.flush()
+        return False
 
     def _update_brightness_label(self):
         """Update the brightness percentage label."""
@@ -385,35 +588,72 @@ class KeyLightWindow(Gtk.ApplicationWindow):
         percentage = int((brightness / 255) * 100)
         self.brightness_label.set_text(f"{percentage}%")
 
-    def _update_toggle_button(self):
-        """Update toggle button state."""
-        is_on = self.controller.brightness > 0
+    def _update_toggle_button(self, brightness: Optional[int] = None):
+        """Update toggle button state.
+
+        Pass the brightness when it is already known to skip the sysfs read.
+        """
+        if brightness is None:
+            brightness = self.controller.brightness
+        is_on = brightness > 0
+        if is_on == self._toggle_on:
+            return  # set_label rebuilds the button's child label
+        self._toggle_on = is_on
         self.toggle_btn.set_label("ON" if is_on else "OFF")
-        ctx = self.toggle_btn.get_style_context()
         if is_on:
-            ctx.remove_class("off")
+            self._toggle_ctx.remove_class("off")
         else:
-            ctx.add_class("off")
+            self._toggle_ctx.add_class("off")
 
     def _on_brightness_changed(self, scale):
-        """Handle brightness slider change."""
-        value = int(scale.get_value())
-        self.controller.brightness = value
-        self.config.brightness = value
+        """Handle brightness slider change.
+
+        Slider drags emit many value changes; only the latest value is
+        applied, at most once per frame (16 ms).
+        """
+        if not self._brightness_dragging:
+            self.controller.retry_privileged()  # Drags retry on press
+        self._pending_brightness = int(scale.get_value())
         self._update_brightness_label()
-        self._update_toggle_button()
-        self.color_preview.queue_draw()
+        if not self._brightness_source:
+            self._brightness_source = GLib.timeout_add(16, self._apply_brightness)
+
+    def _apply_brightness(self):
+        """Write the pending brightness to hardware (and config unless dragging)."""
+        self._brightness_source = 0
+        value = self._pending_brightness
+        self.controller.brightness = value
+        if not self._brightness_dragging:
+            self._set_config("brightness", value)
+        self._update_toggle_button(value)
+        self._redraw_preview()
+        return False
 
-    def _on_color_clicked(self, button, color):
+    def _on_brightness_press(self, scale, event):
+        """Start of a slider drag."""
+        self._brightness_dragging = True
+        self.controller.retry_privileged()
+        return False
+
+    def _on_brightness_release(self, scale, event):
+        """End of a slider drag: persist the final value once."""
+        self._brightness_dragging = False
+        self._set_config("brightness", int(scale.get_value()))
+        return False
+
+    def _on_color_clicked(self, button, preset):
         """Handle preset color button click."""
+        color, rgba, rgb = preset
+        self.controller.retry_privileged()
         self._stop_effect_and_set_static()
 
-        self.controller.set_color_hex(color)
-        self.config.current_color = color
-        self.color_preview.queue_draw()
-
-        rgba = Gdk.RGBA()
-        rgba.parse(color)
+        # Only the hardware write is skipped when the backlight already
+        # shows this color (e.g. the last frame of a stopped effect); the
+        # choice is still saved and shown
+        if self.controller.color != rgb:
+            self.controller.set_color_unchecked(*rgb)
+        self._set_config("current_color", color)
+        self._redraw_preview()
         self.color_button.set_rgba(rgba)
 
         if self.controller.brightness == 0:
@@ -421,53 +661,64 @@ class KeyLightWindow(Gtk.ApplicationWindow):
 
     def _on_custom_color_set(self, button):
         """Handle custom color selection."""
+        self.controller.retry_privileged()
         self._stop_effect_and_set_static()
 
         rgba = button.get_rgba()
         r = int(rgba.red * 255)
         g = int(rgba.green * 255)
         b = int(rgba.blue * 255)
-        color = f"#{r:02X}{g:02X}{b:02X}"
 
-        self.controller.set_color_hex(color)
-        self.config.current_color = color
-        self.color_preview.queue_draw()
+        # Write the channels directly; the hex string is only for the config
+        if self.controller.color != (r, g, b):
+            self.controller.set_color_unchecked(r, g, b)
+        self._set_config("current_color", f"#{r:02X}{g:02X}{b:02X}")
+        self._redraw_preview()
 
         if self.controller.brightness == 0:
             self.brightness_scale.set_value(self.config.brightness or 255)
 
+    def _is_current_color(self, color: str) -> bool:
+        """Check if the backlight already shows the given hex color."""
+        return self.controller.get_color_hex().lstrip('#') == color.lstrip('#').upper()
+
+    def _get_effects(self) -> EffectEngine:
+        """Return the effect engine, creating it on first use."""
+        if self.effects is None:
+            self.effects = EffectEngine(self.controller)
+            self.effects.speed = int(self.speed_scale.get_value())
+            self.effects.set_callback(self._on_effect_color_change)
+        return self.effects
+
     def _stop_effect_and_set_static(self):
         """Stop effect and set combo to static."""
-        self.effects.stop()
+        if self.effects:
+            self.effects.stop()
         self.effect_combo.set_active_id("static")
         self.speed_box.set_visible(False)
 
     def _on_effect_changed(self, combo):
         """Handle effect dropdown change."""
         effect_id = combo.get_active_id()
+        self.controller.retry_privileged()
 
-        self.effects.stop()
+        if self.effects:
+            self.effects.stop()
 
-        # Show/hide speed control
+        # Show/hide speed control (only when it changes, switching between
+        # two effects shouldn't re-show and restyle the whole box)
         show_speed = effect_id != "static"
-        self.speed_box.set_visible(show_speed)
-        self.speed_box.set_no_show_all(not show_speed)
-        if show_speed:
-            self.speed_box.show_all()
+        if self.speed_box.get_visible() != show_speed:
+            self.speed_box.set_visible(show_speed)
+            self.speed_box.set_no_show_all(not show_speed)
+            if show_speed:
+                self.speed_box.show_all()
 
         # Start effect
-        if effect_id == "rainbow":
-            self.effects.start_rainbow()
-        elif effect_id == "breathing":
-            self.effects.start_breathing()
-        elif effect_id == "wave":
-            self.effects.start_color_wave()
-        elif effect_id == "strobe":
-            self.effects.start_strobe()
-        elif effect_id == "candle":
-            self.effects.start_candle()
-        elif effect_id == "police":
-            self.effects.start_police()
+        start = self._EFFECT_STARTERS.get(effect_id)
+        if start:
+            start(self._get_effects())
+            self._start_frame_clock()
 
         if self.controller.brightness == 0:
             self.brightness_scale.set_value(self.config.brightness or 255)
@@ -475,17 +726,56 @@ class KeyLightWindow(Gtk.ApplicationWindow):
     def _on_speed_changed(self, scale):
         """Handle speed slider change."""
         value = int(scale.get_value())
-        self.effects.speed = value
+        if self.effects:
+            self.effects.speed = value
         self.speed_label.set_text(f"{value}%")
 
     def _on_effect_color_change(self, r, g, b):
-        """Called by effect engine when color changes."""
-        GLib.idle_add(self._update_preview_color)
-
-    def _update_preview_color(self):
-        """Update the color preview."""
-        self.color_preview.queue_draw()
-        return False
+        """Called by effect engine (from its thread) when color changes."""
+        # Single-slot handoff: keep only the newest frame for the frame clock
+        with self._preview_lock:
+            self._latest_rgb = (r, g, b)
+            self._preview_dirty = True
+
+    def _start_frame_clock(self):
+        """Redraw the preview at up to 60 Hz while an effect runs."""
+        if not self._frame_source:
+            self._frame_source = GLib.timeout_add(16, self._tick_preview)
+
+    def _tick_preview(self):
+        """Frame clock tick: redraw if the effect changed the color."""
+        with self._preview_lock:
+            dirty = self._preview_dirty
+            self._preview_dirty = False
+            rgb = self._latest_rgb
+        if dirty and rgb != self._preview_rgb:
+            self._preview_rgb = rgb
+            # At zero brightness every frame draws the same black preview
+            if self.brightness_scale.get_value() > 0:
+                self._queue_preview_draw()  # Already once per frame
+        if not (self.effects and self.effects.is_running) or not self.get_visible():
+            # Hidden windows don't need a clock; _on_show restarts it
+            self._frame_source = 0
+            return False
+        return True
+
+    def _on_show(self, widget):
+        """Resume preview updates for a running effect."""
+        if self.effects and self.effects.is_running:
+            self._start_frame_clock()
+
+    def _on_destroy(self, widget):
+        """Remove pending GLib sources owned by the window."""
+        for source in (self._frame_source, self._brightness_source,
+                       self._resize_source, self._draw_source,
+                       self._config_source):
+            if source:
+                GLib.source_remove(source)
+        self._frame_source = self._brightness_source = 0
+        self._resize_source = self._draw_source = 0
+        self._config_source = 0
+        self.watcher.stop()
+        self.config.flush()  # Don't lose deferred changes
 
     def _on_toggle_clicked(self, button):
         """Toggle backlight on/off."""
@@ -493,8 +783,46 @@ class KeyLightWindow(Gtk.ApplicationWindow):
             self.brightness_scale.set_value(0)
         else:
             self.brightness_scale.set_value(self.config.brightness or 255)
-        self._update_toggle_button()
-        self.color_preview.queue_draw()
+
+    def _hardware_sync_blocked(self) -> bool:
+        """Whether sysfs changes are (most likely) our own writes.
+
+        Effects drive the preview themselves, and during a brightness
+        drag or pending apply the slider is ahead of the hardware.
+        """
+        return bool(
+            (self.effects and self.effects.is_running)
+            or self._brightness_source or self._brightness_dragging
+        )
+
+    def _on_backlight_event(self):
+        """Watcher callback: a backlight sysfs file was written."""
+        if not self._hardware_sync_blocked():
+            self._sync_from_hardware()
+
+    def _sync_from_hardware(self):
+        """Update widgets after the backlight was changed externally."""
+
+        brightness = self.controller.brightness
+        color = self.controller.get_color_hex()
+        previous = self._hw_state
+        if (brightness, color) == previous:
+            return False
+        self._hw_state = (brightness, color)
+
+        if int(self.brightness_scale.get_value()) != brightness:
+            # Don't write the value back or store it in the config
+            self.brightness_scale.handler_block_by_func(self._on_brightness_changed)
+            self.brightness_scale.set_value(brightness)
+            self.brightness_scale.handler_unblock_by_func(self._on_brightness_changed)
+            self._update_brightness_label()
+
+        if previous is None or previous[1] != color:
+            self.color_button.set_rgba(_parse_rgba(color))
+
+        self._update_toggle_button(brightness)
+        self._redraw_preview()
+        return False
 
     def _restore_state(self):
         """Restore saved state."""
@@ -502,16 +830,21 @@ class KeyLightWindow(Gtk.ApplicationWindow):
             color = self.config.current_color
             brightness = self.config.brightness
 
-            self.controller.set_color_hex(color)
-            self.controller.brightness = brightness
+            # Only write what differs from the hardware (e.g. first run)
+            if not self._is_current_color(color):
+                self.controller.set_color_hex(color)
+            if self.controller.brightness != brightness:
+                self.controller.brightness = brightness
 
-            self.brightness_scale.set_value(brightness)
+            if int(self.brightness_scale.get_value()) != brightness:
+                # Already applied and saved; don't run the change handler
+                self.brightness_scale.handler_block_by_func(self._on_brightness_changed)
+                self.brightness_scale.set_value(brightness)
+                self.brightness_scale.handler_unblock_by_func(self._on_brightness_changed)
 
-            rgba = Gdk.RGBA()
-            rgba.parse(color)
-            self.color_button.set_rgba(rgba)
+            self.color_button.set_rgba(_parse_rgba(color))
 
-            self.color_preview.queue_draw()
+            self._redraw_preview()
             self._update_toggle_button()
             self._update_brightness_label()
 
@@ -530,6 +863,8 @@ class KeyLightApp(Gtk.Application):
         """Handle application activation."""
         if not self.window:
             self.window = KeyLightWindow(self)
+        elif self.window.is_active():
+            return  # Already visible and focused
         self.window.present()
 
     def do_startup(self):
@@ -3,8 +3,8 @@ Global keyboard shortcut handler for KeyLight.
 Uses D-Bus to register global shortcuts.
 """
 
-import ast
-import subprocess
+import hashlib
+import json
 from typing import Optional
 from pathlib import Path
 
@@ -40,12 +40,9 @@ class ShortcutManager:
         self.controller.toggle()
 
 
-def create_shortcut_script(config: Config) -> Path:
-    """Create a script that can be bound to a keyboard shortcut."""
-    script_path = Path.home() / ".local" / "bin" / "keylight-cycle"
-    script_path.parent.mkdir(parents=True, exist_ok=True)
-
-    script_content = '''#!/usr/bin/env python3
+def _cycle_script_content() -> str:
+    """Source of the keylight-cycle script."""
+    return '''#!/usr/bin/python3 -S
 """KeyLight color cycle script - bind this to a keyboard shortcut."""
 
 import sys
@@ -62,23 +59,9 @@ def main():
         print("Keyboard backlight not available")
         return 1
 
-    # Get cycle colors
+    # Set next cycle color
     colors = config.cycle_colors
-    current = controller.get_color_hex().upper()
-
-    # Find current color index
-    colors_upper = [c.upper().lstrip('#') for c in colors]
-    current_clean = current.lstrip('#')
-
-    try:
-        idx = colors_upper.index(current_clean)
-        next_idx = (idx + 1) % len(colors)
-    except ValueError:
-        next_idx = 0
-
-    # Set new color
-    new_color = colors[next_idx]
-    controller.set_color_hex(new_color)
+    new_color = colors[controller.cycle_color(colors)]
     config.current_color = new_color
 
     # Turn on if off
@@ -92,49 +75,102 @@ if __name__ == "__main__":
     sys.exit(main())
 '''.format(app_path=str(Path(__file__).parent.parent.absolute()))
 
-    script_path.write_text(script_content)
+
+def create_shortcut_script(config: Config) -> Path:
+    """Create a script that can be bound to a keyboard shortcut."""
+    script_path = Path.home() / ".local" / "bin" / "keylight-cycle"
+    script_path.parent.mkdir(parents=True, exist_ok=True)
+    script_path.write_text(_cycle_script_content())
     script_path.chmod(0o755)
     return script_path
 
 
+def _toggle_script_content() -> str:
+    """Source of the keylight-toggle script.
+
+    A plain shell script: toggling only needs two sysfs files and the
+    saved brightness, so a keypress doesn't pay for Python startup. If
+    sysfs isn't writable it hands over to the Python CLI (pkexec path).
+    """
+    return '''#!/bin/sh
+# KeyLight toggle script - bind this to a keyboard shortcut.
+
+LED="{led_path}"
+CONFIG="$HOME/.config/keylight/config.json"
+
+if [ ! -e "$LED/brightness" ]; then
+    echo "Keyboard backlight not available"
+    exit 1
+fi
+
+if [ "$(cat "$LED/brightness")" -gt 0 ]; then
+    value=0
+else
+    value=$(sed -n 's/.*"brightness": *\\([0-9][0-9]*\\).*/\\1/p' "$CONFIG" 2>/dev/null | head -n 1)
+    [ -n "$value" ] && [ "$value" -gt 0 ] || value=255
+    max=$(cat "$LED/max_brightness" 2>/dev/null)
+    [ -n "$max" ] && [ "$value" -gt "$max" ] && value=$max
+fi
+
+if ! {{ printf "%s" "$value" > "$LED/brightness"; }} 2>/dev/null; then
+    # Not writable as this user; the Python controller falls back to pkexec
+    exec python3 "{app_path}/keylight.py" --toggle
+fi
+
+if [ "$value" -gt 0 ]; then
+    echo "Backlight ON"
+else
+    echo "Backlight OFF"
+fi
+'''.format(
+        led_path=KeyboardBacklightController.LED_PATH,
+        app_path=str(Path(__file__).parent.parent.absolute())
+    )
+
+
 def create_toggle_script(config: Config) -> Path:
     """Create a script to toggle backlight on/off."""
     script_path = Path.home() / ".local" / "bin" / "keylight-toggle"
     script_path.parent.mkdir(parents=True, exist_ok=True)
+    script_path.write_text(_toggle_script_content())
+    script_path.chmod(0o755)
+    return script_path
 
-    script_content = '''#!/usr/bin/env python3
-"""KeyLight toggle script - bind this to a keyboard shortcut."""
-
-import sys
-sys.path.insert(0, "{app_path}")
-
-from keylight.controller import KeyboardBacklightController
-from keylight.config import Config
-
-def main():
-    controller = KeyboardBacklightController()
-    config = Config()
 
-    if not controller.available:
-        print("Keyboard backlight not available")
-        return 1
+def ensure_shortcut_scripts(config: Config) -> bool:
+    """Create the shortcut scripts only if they are missing or outdated.
 
-    if controller.brightness > 0:
-        controller.brightness = 0
-        print("Backlight OFF")
-    else:
-        controller.brightness = config.brightness or 255
-        print("Backlight ON")
+    A hash of the script sources and the shortcut settings is kept in
+    the config directory, so unchanged scripts aren't rewritten on every
+    launch. Returns True if the scripts were (re)written.
+    """
+    bin_dir = Path.home() / ".local" / "bin"
+    hash_file = config.config_dir / ".shortcut_hash"
 
-    return 0
+    state = json.dumps({
+        "cycle": _cycle_script_content(),
+        "toggle": _toggle_script_content(),
+        "shortcut_action": config.get("shortcut_action"),
+        "shortcut_enabled": config.get("shortcut_enabled"),
+    }, sort_keys=True)
+    digest = hashlib.sha1(state.encode()).hexdigest()
 
-if __name__ == "__main__":
-    sys.exit(main())
-'''.format(app_path=str(Path(__file__).parent.parent.absolute()))
+    try:
+        stored = hash_file.read_text().strip()
+    except IOError:
+        stored = None
+    if stored == digest and (bin_dir / "keylight-cycle").exists() \
+            and (bin_dir / "keylight-toggle").exists():
+        return False
 
-    script_path.write_text(script_content)
-    script_path.chmod(0o755)
-    return script_path
+    create_shortcut_script(config)
+    create_toggle_script(config)
+    try:
+        config.config_dir.mkdir(parents=True, exist_ok=True)
+        hash_file.write_text(digest)
+    except IOError:
+        pass
+    return True
 
 
 def setup_gnome_shortcut(script_path: Path, shortcut: str = "<Super>space"):
@@ -143,43 +179,35 @@ def setup_gnome_shortcut(script_path: Path, shortcut: str = "<Super>space"):
     Note: This creates a custom shortcut in GNOME settings.
     """
     try:
-        result = subprocess.run(
-            ["gsettings", "get", "org.gnome.settings-daemon.plugins.media-keys", "custom-keybindings"],
-            capture_output=True, text=True
-        )
-        current = result.stdout.strip()
+        # Imported here so the CLI and shortcut scripts don't load GObject
+        from gi.repository import Gio
+
+        media_keys = "org.gnome.settings-daemon.plugins.media-keys"
+        base = f"{media_keys}.custom-keybinding"
+
+        # Gio.Settings aborts on unknown schemas, so check first
+        source = Gio.SettingsSchemaSource.get_default()
+        if source is None or source.lookup(media_keys, True) is None \
+                or source.lookup(base, True) is None:
+            raise RuntimeError("GNOME media-keys schema not installed")
 
         # Create new keybinding path
         binding_path = "/org/gnome/settings-daemon/plugins/media-keys/custom-keybindings/keylight-cycle/"
 
         # Set the binding properties
-        base = "org.gnome.settings-daemon.plugins.media-keys.custom-keybinding"
-        schema_path = f"{base}:{binding_path}"
-
-        subprocess.run(["gsettings", "set", schema_path, "name", "KeyLight Cycle Colors"], check=True)
-        subprocess.run(["gsettings", "set", schema_path, "command", str(script_path)], check=True)
-        subprocess.run(["gsettings", "set", schema_path, "binding", shortcut], check=True)
+        binding = Gio.Settings.new_with_path(base, binding_path)
+        binding.set_string("name", "KeyLight Cycle Colors")
+        binding.set_string("command", str(script_path))
+        binding.set_string("binding", shortcut)
 
         # Add to list of custom keybindings if not present
-        if binding_path not in current:
-            if current == "@as []" or current == "[]":
-                new_bindings = f"['{binding_path}']"
-            else:
-                # Parse existing using ast.literal_eval (safe for literals)
-                try:
-                    bindings = ast.literal_eval(current) if current.startswith('[') else []
-                except (ValueError, SyntaxError):
-                    bindings = []
-                if binding_path not in bindings:
-                    bindings.append(binding_path)
-                new_bindings = str(bindings)
-
-            subprocess.run([
-                "gsettings", "set",
-                "org.gnome.settings-daemon.plugins.media-keys",
-                "custom-keybindings", new_bindings
-            ], check=True)
+        settings = Gio.Settings.new(media_keys)
+        bindings = settings.get_strv("custom-keybindings")
+        if binding_path not in bindings:
+            settings.set_strv("custom-keybindings", bindings + [binding_path])
 
+        # Make sure the writes reach dconf before a short-lived caller exits
+        Gio.Settings.sync()
         return True
     except Exception as e:
         print(f"Failed to set GNOME shortcut: {e}")
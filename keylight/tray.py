@@ -5,17 +5,8 @@ Allows quick access to color controls without opening the main window.
 
 import gi
 gi.require_version('Gtk', '3.0')
-try:
-    gi.require_version('AyatanaAppIndicator3', '0.1')
-    from gi.repository import AyatanaAppIndicator3 as AppIndicator
-    HAS_INDICATOR = True
-except:
-    try:
-        gi.require_version('AppIndicator3', '0.1')
-        from gi.repository import AppIndicator3 as AppIndicator
-        HAS_INDICATOR = True
-    except:
-        HAS_INDICATOR = False
+from functools import lru_cache
+from typing import Optional
 
 from gi.repository import Gtk, GLib
 
@@ -23,6 +14,59 @@ from .controller import KeyboardBacklightController
 from .config import Config
 
 
+# Quick Colors submenu entries (name, hex)
+_PRESET_COLORS = (
+    ("White", "#FFFFFF"),
+    ("Red", "#FF0000"),
+    ("Green", "#00FF00"),
+    ("Blue", "#0000FF"),
+    ("Yellow", "#FFFF00"),
+    ("Cyan", "#00FFFF"),
+    ("Magenta", "#FF00FF"),
+    ("Orange", "#FF8000"),
+)
+
+# Brightness submenu entries (label, 0-255 value)
+_BRIGHTNESS_PRESETS = tuple(
+    (f"{level}%", int(level * 2.55)) for level in (100, 75, 50, 25, 10)
+)
+
+
+# Tray menu layout: ("item", label, handler), ("toggle", label, handler),
+# ("submenu", label, submenu builder) or ("sep",)
+_MENU_SPEC = (
+    ("item", "Open KeyLight", "_on_show"),
+    ("sep",),
+    ("submenu", "Quick Colors", "_build_colors_menu"),
+    ("submenu", "Brightness", "_build_brightness_menu"),
+    ("sep",),
+    ("toggle", "Turn Off", "_on_toggle"),
+    ("sep",),
+    ("item", "Quit", "_on_quit"),
+)
+
+
+@lru_cache(maxsize=1)
+def _load_indicator():
+    """Import the AppIndicator bindings on first use (None if missing).
+
+    Probing loads a typelib, so it is done when the tray is created
+    rather than when this module is imported.
+    """
+    try:
+        gi.require_version('AyatanaAppIndicator3', '0.1')
+        from gi.repository import AyatanaAppIndicator3 as AppIndicator
+        return AppIndicator
+    except (ValueError, ImportError):
+        pass
+    try:
+        gi.require_version('AppIndicator3', '0.1')
+        from gi.repository import AppIndicator3 as AppIndicator
+        return AppIndicator
+    except (ValueError, ImportError):
+        return None
+
+
 class TrayIcon:
     """System tray icon with quick controls."""
 
@@ -32,11 +76,22 @@ class TrayIcon:
         self.config = config
         self.indicator = None
 
-        if HAS_INDICATOR:
-            self._create_indicator()
+        # Menu selections waiting for the next idle flush
+        self._pending = {}
+        self._idle_id = 0
+        self._toggle_on = None  # State the toggle item's label shows
+
+        # Built once the main loop is idle, so probing for AppIndicator,
+        # the menu's widgets and its D-Bus export don't delay the first
+        # window paint. self.indicator stays None if it isn't available.
+        GLib.idle_add(self._create_indicator, priority=GLib.PRIORITY_LOW)
 
     def _create_indicator(self):
         """Create the app indicator."""
+        AppIndicator = _load_indicator()
+        if AppIndicator is None:
+            return False
+
         self.indicator = AppIndicator.Indicator.new(
             "keylight",
             "keyboard-brightness-symbolic",
@@ -48,101 +103,153 @@ class TrayIcon:
         # Create menu
         menu = self._create_menu()
         self.indicator.set_menu(menu)
+        return False
 
     def _create_menu(self) -> Gtk.Menu:
-        """Create the tray menu."""
+        """Create the tray menu from _MENU_SPEC."""
         menu = Gtk.Menu()
 
-        # Show window
-        item_show = Gtk.MenuItem(label="Open KeyLight")
-        item_show.connect("activate", self._on_show)
-        menu.append(item_show)
+        # Bound once; each Gtk.* lookup goes through the GI module proxy
+        MenuItem = Gtk.MenuItem
+        SeparatorMenuItem = Gtk.SeparatorMenuItem
+        append = menu.append
+
+        for entry in _MENU_SPEC:
+            kind = entry[0]
+            if kind == "sep":
+                append(SeparatorMenuItem())
+                continue
+
+            item = MenuItem(label=entry[1])
+            if kind == "submenu":
+                item.set_submenu(getattr(self, entry[2])())
+            else:
+                item.connect("activate", getattr(self, entry[2]))
+                if kind == "toggle":
+                    self.toggle_item = item
+                    self._toggle_on = True  # Label starts as "Turn Off"
+            append(item)
 
-        menu.append(Gtk.SeparatorMenuItem())
+        menu.show_all()
+        return menu
 
-        # Quick colors submenu
-        item_colors = Gtk.MenuItem(label="Quick Colors")
+    def _build_colors_menu(self) -> Gtk.Menu:
+        """Create the Quick Colors submenu."""
         colors_menu = Gtk.Menu()
 
-        preset_colors = [
-            ("White", "#FFFFFF"),
-            ("Red", "#FF0000"),
-            ("Green", "#00FF00"),
-            ("Blue", "#0000FF"),
-            ("Yellow", "#FFFF00"),
-            ("Cyan", "#00FFFF"),
-            ("Magenta", "#FF00FF"),
-            ("Orange", "#FF8000"),
-        ]
-
-        for name, color in preset_colors:
-            item = Gtk.MenuItem(label=name)
-            item.connect("activate", self._on_color_select, color)
-            colors_menu.append(item)
-
-        item_colors.set_submenu(colors_menu)
-        menu.append(item_colors)
-
-        # Brightness submenu
-        item_brightness = Gtk.MenuItem(label="Brightness")
+        # One bound handler for all items; each item carries its value
+        on_color = self._on_color_select
+        MenuItem = Gtk.MenuItem
+        append = colors_menu.append
+        for name, color in _PRESET_COLORS:
+            item = MenuItem(label=name)
+            item.color_hex = color
+            item.connect("activate", on_color)
+            append(item)
+        return colors_menu
+
+    def _build_brightness_menu(self) -> Gtk.Menu:
+        """Create the Brightness submenu."""
         brightness_menu = Gtk.Menu()
 
-        for level in [100, 75, 50, 25, 10]:
-            item = Gtk.MenuItem(label=f"{level}%")
-            item.connect("activate", self._on_brightness_select, int(level * 2.55))
-            brightness_menu.append(item)
-
-        item_brightness.set_submenu(brightness_menu)
-        menu.append(item_brightness)
-
-        menu.append(Gtk.SeparatorMenuItem())
-
-        # Toggle on/off
-        self.toggle_item = Gtk.MenuItem(label="Turn Off")
-        self.toggle_item.connect("activate", self._on_toggle)
-        menu.append(self.toggle_item)
-
-        menu.append(Gtk.SeparatorMenuItem())
-
-        # Quit
-        item_quit = Gtk.MenuItem(label="Quit")
-        item_quit.connect("activate", self._on_quit)
-        menu.append(item_quit)
-
-        menu.show_all()
-        return menu
+        on_brightness = self._on_brightness_select
+        MenuItem = Gtk.MenuItem
+        append = brightness_menu.append
+        for label, value in _BRIGHTNESS_PRESETS:
+            item = MenuItem(label=label)
+            item.brightness_value = value
+            item.connect("activate", on_brightness)
+            append(item)
+        return brightness_menu
 
     def _on_show(self, item):
         """Show the main window."""
         if self.app.window:
             self.app.window.present()
 
-    def _on_color_select(self, item, color: str):
+    def _on_color_select(self, item):
         """Handle color selection from tray."""
-        self.controller.set_color_hex(color)
-        self.config.current_color = color
-        if self.controller.brightness == 0:
-            self.controller.brightness = self.config.brightness or 255
-        self._update_toggle_label()
+        self._pending["color"] = item.color_hex
+        self._schedule_flush()
 
-    def _on_brightness_select(self, item, brightness: int):
+    def _on_brightness_select(self, item):
         """Handle brightness selection from tray."""
-        self.controller.brightness = brightness
-        self.config.brightness = brightness
-        self._update_toggle_label()
+        self._pending["brightness"] = item.brightness_value
+        self._schedule_flush()
 
     def _on_toggle(self, item):
         """Toggle backlight on/off."""
-        is_on = self.controller.toggle()
-        if is_on:
-            self.controller.brightness = self.config.brightness or 255
-        self._update_toggle_label()
-
-    def _update_toggle_label(self):
-        """Update toggle menu item label."""
-        is_on = self.controller.brightness > 0
+        # Two toggles before the flush cancel out
+        self._pending["toggle"] = not self._pending.get("toggle", False)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Apply pending selections once the main loop is idle."""
+        if not self._idle_id:
+            self._idle_id = GLib.idle_add(
+                self._flush_pending, priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+
+    def _flush_pending(self):
+        """Apply the latest pending color, brightness and toggle in one pass."""
+        self._idle_id = 0
+        pending, self._pending = self._pending, {}
+        self.controller.retry_privileged()  # Menu picks are user actions
+
+        # Read the hardware brightness once per flush and track what this
+        # pass writes. It isn't kept between flushes, since the GUI, CLI
+        # and shortcut scripts change the backlight too.
+        current = self.controller.brightness
+        target = current
+
+        with self.config:
+            color = pending.get("color")
+            if color:
+                self.controller.set_color_hex(color)
+                self.config.current_color = color
+
+            brightness = pending.get("brightness")
+            if brightness is not None:
+                target = brightness
+                self.config.brightness = brightness
+            elif color and target == 0:
+                # Picking a color turns the backlight on
+                target = self.config.brightness or 255
+
+            if pending.get("toggle"):
+                target = 0 if target > 0 else (self.config.brightness or 255)
+
+            if target != current:
+                self.controller.brightness = target
+
+        self._update_toggle_label(target)
+        return False
+
+    def _update_toggle_label(self, brightness: Optional[int] = None):
+        """Update toggle menu item label.
+
+        Pass the brightness when it is already known to skip the sysfs read.
+        """
+        if brightness is None:
+            brightness = self.controller.brightness
+        is_on = brightness > 0
+        if is_on == self._toggle_on:
+            return
+        self._toggle_on = is_on
         self.toggle_item.set_label("Turn Off" if is_on else "Turn On")
 
     def _on_quit(self, item):
         """Quit the application."""
+        self._teardown()
         self.app.quit()
+
+    def _teardown(self):
+        """Apply pending selections and drop the indicator before quitting."""
+        if self._idle_id:
+            GLib.source_remove(self._idle_id)
+            self._flush_pending()
+        if self.indicator:
+            # Remove the icon right away instead of when the process exits
+            self.indicator.set_status(_load_indicator().IndicatorStatus.PASSIVE)
+            self.indicator = None
+        self.toggle_item = None
@@ -0,0 +1,52 @@
+"""
+Watches the keyboard backlight sysfs files for external changes.
+Keeps the GUI in sync when the shortcut scripts or CLI change the backlight.
+"""
+
+from typing import Callable, List
+
+from gi.repository import Gio, GLib
+
+from .controller import KeyboardBacklightController
+
+
+class BacklightWatcher:
+    """Calls a callback whenever brightness or color are written.
+
+    Uses GIO file monitors, which run on the main loop, so no thread or
+    polling timer is needed. GIO rate-limits CHANGED events per file, so
+    a burst of writes (e.g. a running effect) is reported only a few
+    times per second. Sysfs reports our own writes too; the callback is
+    expected to ignore those.
+    """
+
+    def __init__(self, controller: KeyboardBacklightController, callback: Callable):
+        self.controller = controller
+        self.callback = callback
+        self._monitors: List[Gio.FileMonitor] = []
+
+    def start(self) -> bool:
+        """Start watching. Returns False if the files can't be monitored."""
+        if not self.controller.available:
+            return False
+        try:
+            for name in ("brightness", "multi_intensity"):
+                gfile = Gio.File.new_for_path(str(self.controller.LED_PATH / name))
+                monitor = gfile.monitor_file(Gio.FileMonitorFlags.NONE, None)
+                monitor.connect("changed", self._on_changed)
+                self._monitors.append(monitor)
+        except GLib.Error:
+            self.stop()
+            return False
+        return True
+
+    def stop(self):
+        """Stop watching."""
+        for monitor in self._monitors:
+            monitor.cancel()
+        self._monitors = []
+
+    def _on_changed(self, monitor, gfile, other_file, event_type):
+        """Report content changes to the callback."""
+        if event_type == Gio.FileMonitorEvent.CHANGED:
+            self.callback()